@@ -1,13 +1,15 @@
 import argparse
 import logging
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import List
 
 import zipfile
 import json
 
 from adobe.pdfservices.operation.auth.service_principal_credentials import ServicePrincipalCredentials
-from adobe.pdfservices.operation.exception.exceptions import ServiceApiException, ServiceUsageException, SdkException
 from adobe.pdfservices.operation.pdf_services_media_type import PDFServicesMediaType
 from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
 from adobe.pdfservices.operation.io.stream_asset import StreamAsset
@@ -28,50 +30,49 @@ logging.basicConfig(level=logging.INFO)
 
 
 
+# Extraction parameters never change between jobs, so build them once and share
+# them across every submission (including concurrent ones).
+EXTRACT_PDF_PARAMS = ExtractPDFParams(
+    elements_to_extract=[ExtractElementType.TEXT, ExtractElementType.TABLES],
+    # elements_to_extract_renditions=[ExtractRenditionsElementType.TABLES],
+    add_char_info=False,
+    styling_info=False,
+    # table_structure_type=TableStructureType.CSV,
+)
+
+
 # This sample illustrates how to extract Text Information from PDF.
 #
 # Refer to README.md for instructions on how to run the samples & understand output zip file.
 
 class ExtractTextInfoFromPDF:
     def __init__(self, base_dir: Path):
-        try:
-            pdf_path = self._locate_pdf(base_dir)
-            with pdf_path.open('rb') as file:
-                input_stream = file.read()
-            
-            # Initialize PDF Services client
-            credentials = ServicePrincipalCredentials(
-                client_id=os.getenv('PDF_SERVICES_CLIENT_ID'),
-                client_secret=os.getenv('PDF_SERVICES_CLIENT_SECRET')
-            )
-            pdf_services = PDFServices(credentials=credentials)
-            
-            # Upload PDF to Adobe services
-            input_asset = pdf_services.upload(input_stream=input_stream, mime_type=PDFServicesMediaType.PDF)
-            
-            # Create and submit extraction job
-            pdf_services_response = self._execute_extraction_job(pdf_services, input_asset)
-            
-            # Download extraction results
-            output_file_path = self._download_results(pdf_services, pdf_services_response, base_dir)
-            
-
-        except (ServiceApiException, ServiceUsageException, SdkException) as e:
-            logging.exception(f'Exception encountered while executing operation: {e}')
+        # Errors (including SDK service/usage exceptions) propagate to the caller;
+        # extract_directories logs them per directory and reports the failure.
+        pdf_path = self._locate_pdf(base_dir)
+        
+        # Initialize PDF Services client
+        credentials = ServicePrincipalCredentials(
+            client_id=os.getenv('PDF_SERVICES_CLIENT_ID'),
+            client_secret=os.getenv('PDF_SERVICES_CLIENT_SECRET')
+        )
+        pdf_services = PDFServices(credentials=credentials)
+        
+        # Upload PDF to Adobe services, streaming straight from the open file
+        # rather than reading the whole document into memory first
+        with pdf_path.open('rb') as file:
+            input_asset = pdf_services.upload(input_stream=file, mime_type=PDFServicesMediaType.PDF)
+        
+        # Create and submit extraction job
+        pdf_services_response = self._execute_extraction_job(pdf_services, input_asset)
+        
+        # Download extraction results
+        output_file_path = self._download_results(pdf_services, pdf_services_response, base_dir)
 
     def _execute_extraction_job(self, pdf_services: PDFServices, input_asset):
         """Stage 4: Create and submit extraction job, then wait for results."""
-        # Create parameters for the job
-        extract_pdf_params = ExtractPDFParams(
-            elements_to_extract=[ExtractElementType.TEXT, ExtractElementType.TABLES],
-            # elements_to_extract_renditions=[ExtractRenditionsElementType.TABLES],
-            add_char_info=False,
-            styling_info=False,
-            # table_structure_type=TableStructureType.CSV,
-        )
-
         # Create and submit job
-        extract_pdf_job = ExtractPDFJob(input_asset=input_asset, extract_pdf_params=extract_pdf_params)
+        extract_pdf_job = ExtractPDFJob(input_asset=input_asset, extract_pdf_params=EXTRACT_PDF_PARAMS)
         location = pdf_services.submit(extract_pdf_job)
         
         # Get job result
@@ -106,17 +107,53 @@ class ExtractTextInfoFromPDF:
         return base_dir / "extract.zip"
 
 
+def extract_directories(directories: List[Path], max_workers: int = 8) -> List[Path]:
+    """Run one extraction per directory, overlapping the I/O-bound upload/poll/download stages.
+
+    Every directory is attempted; failures are logged per directory and the failed
+    directories are returned.
+    """
+    failed: List[Path] = []
+    if not directories:
+        return failed
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(directories))) as executor:
+        futures = {executor.submit(ExtractTextInfoFromPDF, directory): directory for directory in directories}
+        for future in as_completed(futures):
+            directory = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f'Extraction failed for {directory}: {e}', exc_info=e)
+                failed.append(directory)
+    return failed
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Extract text and table data from a PDF using Adobe PDF Services.")
     parser.add_argument(
-        "directory",
-        nargs="?",
-        default="CabanaClub",
-        help="Directory containing the source PDF; results will be written here as well.",
+        "directories",
+        nargs="*",
+        default=["CabanaClub"],
+        help="Directories each containing one source PDF; results will be written alongside it.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=positive_int,
+        default=8,
+        help="Maximum number of extractions to run concurrently.",
     )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    ExtractTextInfoFromPDF(Path(args.directory))
+    failed = extract_directories([Path(directory) for directory in args.directories], max_workers=args.max_workers)
+    if failed:
+        sys.exit(1)
@@ -1,179 +1,344 @@
 import argparse
 import json
-import re
 import sys
 import textwrap
 import zipfile
-from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+MIN_COL_WIDTH = 3
+MAX_COL_WIDTH = 36
+
+ROW_HAS_TD = 1
+ROW_HAS_TH = 2
+
+
+@dataclass(slots=True)
+class TableState:
+    """Per-table state collected while walking the structured data elements."""
+
+    id: str
+    title: Optional[str]
+    page: Optional[int]
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    # Cell fragments keyed by (row index, column position); a lone fragment is
+    # stored as a plain string and only upgraded to a list when a second arrives.
+    cells: Dict[Tuple[int, int], Union[str, List[str]]] = field(default_factory=dict)
+    max_row: int = 0
+    max_col: int = 0
+    # Per-row bitmask of ROW_HAS_TD / ROW_HAS_TH.
+    row_flags: Dict[int, int] = field(default_factory=dict)
+    column_order: Dict[int, Dict[Tuple[str, int], int]] = field(default_factory=dict)
+
+
+def _load_json(handle: IO[bytes]) -> Any:
+    """Parse JSON from a binary file object, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(handle.read())
+    return json.load(handle)
+
+
+def _write_json(payload: Dict[str, Any], output_path: Path) -> None:
+    """Write a payload as indented JSON, preferring orjson when it is installed."""
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(payload, indent=2))
+
+
+def _json_member(archive: zipfile.ZipFile) -> str:
+    """Return the name of the first JSON member in the extraction zip."""
+    json_members = [name for name in archive.namelist() if name.lower().endswith(".json")]
+    if not json_members:
+        raise ValueError("No JSON members found in the provided zip file.")
+    return sorted(json_members)[0]
 
-def load_structured_data(zip_path: str) -> Dict:
+
+def load_structured_data(zip_path: Union[str, Path]) -> Dict[str, Any]:
     """Load the first JSON payload contained in the extraction zip."""
     with zipfile.ZipFile(zip_path, "r") as archive:
-        json_members = [name for name in archive.namelist() if name.lower().endswith(".json")]
-        if not json_members:
-            raise ValueError("No JSON members found in the provided zip file.")
-        member = sorted(json_members)[0]
-        return json.loads(archive.read(member))
-
+        with archive.open(_json_member(archive)) as handle:
+            data: Dict[str, Any] = _load_json(handle)
+        return data
+
+
+def iter_structured_elements(zip_path: Union[str, Path], stream: bool = False) -> Iterator[Dict[str, Any]]:
+    """Yield the structured data elements one at a time.
+
+    By default the whole payload is parsed up front (with orjson when installed),
+    which is the fastest path. With ``stream=True`` the elements array is parsed
+    incrementally with ijson so only the current element is held in memory; this
+    is roughly 1.5-2x slower than orjson but keeps peak memory low on very large outputs.
+    Both paths raise ``KeyError`` when the payload has no ``elements`` key.
+    """
+    if not stream:
+        yield from load_structured_data(zip_path)["elements"]
+        return
+    if ijson is None:
+        raise ImportError("Streaming the structured data requires the ijson package.")
 
-def parse_segment(segment: str) -> Tuple[str, int]:
-    """Break a segment like TD[3] into its base name and 1-based index."""
-    match = re.match(r"(?P<name>[A-Za-z]+)(?:\[(?P<index>\d+)\])?$", segment)
-    if not match:
-        return segment, 1
-    name = match.group("name")
-    index = int(match.group("index") or "1")
-    return name, index
+    found_elements = False
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        member = _json_member(archive)
+        with archive.open(member) as handle:
+            for element in ijson.items(handle, "elements.item", use_float=True):
+                found_elements = True
+                yield element
+        if not found_elements:
+            # Nothing was yielded: tell an empty elements array apart from a missing key.
+            with archive.open(member) as handle:
+                has_elements = any(
+                    not prefix and event == "map_key" and value == "elements"
+                    for prefix, event, value in ijson.parse(handle)
+                )
+            if not has_elements:
+                raise KeyError("elements")
+
+
+def _skip_index(path: str, pos: int) -> int:
+    """Return the offset just past an ``[n]`` index at ``pos``, or ``pos`` if there is none."""
+    if path.startswith("[", pos):
+        close = path.find("]", pos + 1)
+        if close > pos + 1 and path[pos + 1 : close].isdecimal():
+            return close + 1
+    return pos
+
+
+def _find_table_end(path: str) -> int:
+    """Return the end offset of the first ``/Table[n]`` segment in a path, or -1."""
+    pos = path.find("/Table")
+    if pos < 0:
+        return -1
+    return _skip_index(path, pos + 6)
+
+
+def _find_heading(path: str) -> Optional[Tuple[str, int]]:
+    """Return the path up to the first ``/H1``..``/H6[n]`` segment and its level."""
+    pos = path.find("/H")
+    while pos >= 0:
+        level = path[pos + 2 : pos + 3]
+        if level and level in "123456":
+            return path[: _skip_index(path, pos + 3)], int(level)
+        pos = path.find("/H", pos + 2)
+    return None
+
+
+def _parse_cell_path(path: str, start: int) -> Optional[Tuple[int, int, str]]:
+    """Return the (row, column, TD/TH) indices from the cell segments after ``start``."""
+    row_index: Optional[int] = None
+    col_index: Optional[int] = None
+    col_type: Optional[str] = None
+
+    path_len = len(path)
+    pos = path.find("/", start)
+    while pos >= 0:
+        next_pos = path.find("/", pos + 1)
+        segment_end = path_len if next_pos < 0 else next_pos
+        name = path[pos + 1 : pos + 3]
+        if name == "TR" or name == "TD" or name == "TH":
+            name_end = pos + 3
+            if name_end == segment_end:
+                idx = 1
+            else:
+                index_end = _skip_index(path, name_end)
+                idx = int(path[name_end + 1 : index_end - 1]) if index_end == segment_end != name_end else -1
+            if idx >= 0:
+                if name == "TR":
+                    row_index = idx
+                else:
+                    col_index = idx
+                    col_type = name
+        pos = next_pos
+
+    if row_index is None or col_index is None or col_type is None:
+        return None
+    return row_index, col_index, col_type
 
 
+@lru_cache(maxsize=4096)
 def normalize_fragment(text: str) -> str:
     """Collapse whitespace while keeping the original token order."""
-    cleaned = re.sub(r"\s+", " ", text.replace("\u00a0", " ")).strip()
-    return cleaned
+    # str.split() treats every Unicode whitespace character (NBSP included) as a separator.
+    return " ".join(text.split())
 
 
-def current_heading_title(heading_by_level: Dict[int, str]) -> Optional[str]:
-    """Return the deepest heading that has been seen so far."""
-    if not heading_by_level:
-        return None
-    deepest_level = max(heading_by_level)
-    return heading_by_level[deepest_level]
+# A table together with its assembled rows, header row count and column widths.
+AssembledTable = Tuple[TableState, List[List[str]], int, List[int]]
 
 
-def extract_tables(elements: List[Dict]) -> List[Dict]:
+def extract_tables(elements: Iterable[Dict[str, Any]]) -> List[TableState]:
     """Iterate through elements and assemble table structures."""
-    table_pattern = re.compile(r"/Table(\[\d+\])?")
-    heading_pattern = re.compile(r"(.*?/H([1-6])(?:\[\d+\])?)")
-
-    heading_fragments: Dict[str, List[str]] = defaultdict(list)
-    heading_by_level: Dict[int, str] = {}
-
-    tables: Dict[str, Dict] = {}
+    # Accumulated title and last fragment seen for each heading path.
+    heading_titles: Dict[str, Tuple[str, str]] = {}
+    # Indexed by heading level H1..H6; slot 0 is unused.
+    heading_by_level: List[Optional[str]] = [None] * 7
+    # Level of the deepest heading that currently applies (0 before any heading).
+    deepest_level = 0
+
+    tables: Dict[str, TableState] = {}
     table_order: List[str] = []
+    # Cell elements grouped per table as (path, offset past the table root, text).
+    table_cells: Dict[str, List[Tuple[str, int, str]]] = {}
 
+    # Local aliases keep attribute lookups out of the per-element loop.
+    find_heading = _find_heading
+    find_table_end = _find_table_end
+    parse_cell_path = _parse_cell_path
+    normalize = normalize_fragment
+
+    # First pass: track headings, register tables and bucket their cell elements.
     for element in elements:
         path = element["Path"]
         text = element.get("Text", "")
 
         # Track the most recent heading so we can label tables with it.
-        if text:
-            heading_match = heading_pattern.search(path)
-            if heading_match:
-                heading_path = heading_match.group(1)
-                level = int(heading_match.group(2))
-                fragment = normalize_fragment(text)
+        if text and "/H" in path:
+            heading = find_heading(path)
+            if heading is not None:
+                heading_path, level = heading
+                fragment = normalize(text)
                 if fragment:
-                    fragments = heading_fragments[heading_path]
-                    if not fragments or fragments[-1] != fragment:
-                        fragments.append(fragment)
-                    heading_by_level[level] = " ".join(fragments)
+                    previous = heading_titles.get(heading_path)
+                    if previous is None:
+                        title = fragment
+                    elif previous[1] != fragment:
+                        title = previous[0] + " " + fragment
+                    else:
+                        title = previous[0]
+                    heading_titles[heading_path] = (title, fragment)
+                    heading_by_level[level] = title
                     # Any headings deeper than this level no longer apply.
-                    for deeper in [lvl for lvl in heading_by_level if lvl > level]:
-                        heading_by_level.pop(deeper, None)
+                    for deeper in range(level + 1, 7):
+                        heading_by_level[deeper] = None
+                    # Deeper levels were just cleared, so this heading is now the deepest.
+                    deepest_level = level
 
-        table_match = table_pattern.search(path)
-        if not table_match:
+        table_end = find_table_end(path)
+        if table_end < 0:
             continue
 
-        table_root = path[: table_match.end()]
-        if table_root not in tables:
-            tables[table_root] = {
-                "id": table_root,
-                "title": current_heading_title(heading_by_level),
-                "page": element.get("Page"),
-                "attributes": {},
-                "cells": defaultdict(lambda: defaultdict(list)),
-                "row_meta": defaultdict(lambda: {"has_th": False, "has_td": False}),
-                "column_order": defaultdict(dict),
-            }
+        table_root = path[:table_end]
+        page = element.get("Page")
+        table = tables.get(table_root)
+        if table is None:
+            table = tables[table_root] = TableState(
+                id=table_root,
+                title=heading_by_level[deepest_level],
+                page=page,
+            )
             table_order.append(table_root)
+            table_cells[table_root] = []
 
-        table = tables[table_root]
-        if table.get("page") is None and element.get("Page") is not None:
-            table["page"] = element.get("Page")
+        if table.page is None and page is not None:
+            table.page = page
 
         # Capture table level metadata if present.
         if path == table_root:
             attrs = element.get("attributes")
             if attrs:
-                table["attributes"] = attrs
-            if table.get("title") is None:
-                table["title"] = current_heading_title(heading_by_level)
+                table.attributes = attrs
+            if table.title is None:
+                table.title = heading_by_level[deepest_level]
             continue
 
         if "Text" not in element:
             continue
+        table_cells[table_root].append((path, table_end, text))
 
-        remainder = path[table_match.end() :]
-        segments = [seg for seg in remainder.split("/") if seg]
-
-        row_index: Optional[int] = None
-        col_index: Optional[int] = None
-        col_type: Optional[str] = None
-
-        for segment in segments:
-            name, idx = parse_segment(segment)
-            if name == "TR":
-                row_index = idx
-            elif name in {"TD", "TH"}:
-                col_index = idx
-                col_type = name
+    # Second pass: place each table's cell fragments without any heading work.
+    for table_root in table_order:
+        table = tables[table_root]
+        cells = table.cells
+        row_flags = table.row_flags
+        column_order_by_row = table.column_order
 
-        if row_index is None or col_index is None or col_type is None:
-            continue
+        for path, table_end, text in table_cells[table_root]:
+            cell = parse_cell_path(path, table_end)
+            if cell is None:
+                continue
+            row_index, col_index, col_type = cell
 
-        fragment = normalize_fragment(text)
-        if not fragment:
-            continue
-        column_order = table["column_order"][row_index]
-        cell_key = (col_type, col_index)
-        if cell_key not in column_order:
-            column_order[cell_key] = len(column_order) + 1
-        col_position = column_order[cell_key]
-
-        table["cells"][row_index][col_position].append(fragment)
-        row_meta = table["row_meta"][row_index]
-        if col_type == "TH":
-            row_meta["has_th"] = True
-        else:
-            row_meta["has_td"] = True
+            fragment = normalize(text)
+            if not fragment:
+                continue
+            column_order = column_order_by_row.setdefault(row_index, {})
+            cell_key = (col_type, col_index)
+            if cell_key not in column_order:
+                column_order[cell_key] = len(column_order) + 1
+            col_position = column_order[cell_key]
+
+            position = (row_index, col_position)
+            entry = cells.get(position)
+            if entry is None:
+                cells[position] = fragment
+            elif isinstance(entry, str):
+                cells[position] = [entry, fragment]
+            else:
+                entry.append(fragment)
+            if row_index > table.max_row:
+                table.max_row = row_index
+            if col_position > table.max_col:
+                table.max_col = col_position
+            flag = ROW_HAS_TH if col_type == "TH" else ROW_HAS_TD
+            row_flags[row_index] = row_flags.get(row_index, 0) | flag
 
     return [tables[key] for key in table_order]
 
 
-def assemble_rows(table: Dict) -> Tuple[List[List[str]], int]:
-    """Convert collected cell fragments into ordered rows."""
-    cells = table["cells"]
-    attributes = table.get("attributes", {})
+def assemble_rows(table: TableState) -> Tuple[List[List[str]], int, List[int]]:
+    """Convert collected cell fragments into ordered rows, header row count and column widths."""
+    cells = table.cells
+    attributes = table.attributes
     declared_cols = attributes.get("NumCol", 0)
 
-    observed_cols = 0
-    for cols in cells.values():
-        if cols:
-            observed_cols = max(observed_cols, max(cols.keys()))
-
-    num_cols = max(declared_cols, observed_cols)
+    num_cols = max(declared_cols, table.max_col)
     if num_cols == 0:
-        return [], 0
+        return [], 0, []
 
     ordered_rows: List[List[str]] = []
     header_rows = 0
     header_phase = True
-
-    for row_index in sorted(cells.keys()):
-        row_cells = cells[row_index]
-        row_values = []
-        for col_idx in range(1, num_cols + 1):
-            fragments = row_cells.get(col_idx, [])
-            value = " ".join(fragments).strip()
-            row_values.append(value)
-
+    # Longest cell per column, gathered while the rows are filled in.
+    col_longest = [0] * num_cols
+    values_by_row: Dict[int, List[str]] = {}
+
+    # Only occupied cells are visited; most cells hold a single fragment string.
+    for (row_index, col_idx), entry in cells.items():
+        row_values = values_by_row.get(row_index)
+        if row_values is None:
+            row_values = values_by_row[row_index] = [""] * num_cols
+        if isinstance(entry, str):
+            value = entry.strip()
+        else:
+            value = " ".join(entry).strip()
+        if value:
+            row_values[col_idx - 1] = value
+            if value.isprintable():
+                longest = len(value)
+            else:
+                longest = max(len(line) for line in value.splitlines())
+            if longest > col_longest[col_idx - 1]:
+                col_longest[col_idx - 1] = longest
+
+    # Row indices are small and dense, so walking 0..max_row beats sorting them.
+    for row_index in range(table.max_row + 1):
+        row_values = values_by_row.get(row_index)
+        if row_values is None:
+            continue
         if header_phase:
-            meta = table["row_meta"].get(row_index, {})
-            is_header = meta.get("has_th") and not meta.get("has_td")
-            if is_header:
+            if table.row_flags.get(row_index, 0) == ROW_HAS_TH:
                 header_rows += 1
             else:
                 header_phase = False
@@ -181,16 +346,22 @@ def assemble_rows(table: Dict) -> Tuple[List[List[str]], int]:
 
     # Drop trailing columns that are empty in every row for readability.
     last_non_empty = -1
-    for col_idx in range(num_cols):
-        if any(row[col_idx] for row in ordered_rows):
+    for col_idx in range(num_cols - 1, -1, -1):
+        if col_longest[col_idx]:
             last_non_empty = col_idx
+            break
 
     if last_non_empty >= 0:
         ordered_rows = [row[: last_non_empty + 1] for row in ordered_rows]
     else:
         ordered_rows = [[] for _ in ordered_rows]
 
-    return ordered_rows, header_rows
+    widths: List[int] = []
+    if ordered_rows:
+        widths = [
+            max(MIN_COL_WIDTH, min(longest, MAX_COL_WIDTH)) for longest in col_longest[: last_non_empty + 1]
+        ]
+    return ordered_rows, header_rows, widths
 
 
 def compute_column_widths(rows: List[List[str]]) -> List[int]:
@@ -199,7 +370,7 @@ def compute_column_widths(rows: List[List[str]]) -> List[int]:
         return []
 
     num_cols = max(len(row) for row in rows)
-    widths = [3] * num_cols
+    widths = [MIN_COL_WIDTH] * num_cols
 
     for col_idx in range(num_cols):
         longest = 0
@@ -211,100 +382,132 @@ def compute_column_widths(rows: List[List[str]]) -> List[int]:
                 continue
             for line in cell.splitlines():
                 longest = max(longest, len(line))
-        widths[col_idx] = max(3, min(longest, 36))
+        widths[col_idx] = max(MIN_COL_WIDTH, min(longest, MAX_COL_WIDTH))
 
     return widths
 
 
+@lru_cache(maxsize=4096)
+def _wrap_cached(text: str, width: int) -> Tuple[str, ...]:
+    """Memoized textwrap for cell contents that repeat across rows."""
+    return tuple(textwrap.wrap(text, width=width, replace_whitespace=False) or ("",))
+
+
+def _wrap_lines(text: str, width: int) -> Tuple[str, ...]:
+    """Wrap text, returning empty and already-fitting cells without calling textwrap."""
+    if not text:
+        return ("",)
+    # textwrap leaves a short single-line cell untouched unless it has tabs, line
+    # breaks or trailing whitespace to drop.
+    if len(text) <= width and text.isprintable() and not text.endswith(" "):
+        return (text,)
+    return _wrap_cached(text, width)
+
+
 def wrap_cell(text: str, width: int) -> List[str]:
     """Wrap a cell's text to the provided width."""
     if width <= 0:
         return [text]
-    lines = textwrap.wrap(text, width=width, replace_whitespace=False) or [""]
-    return lines
+    return list(_wrap_lines(text, width))
 
 
-def render_table(rows: List[List[str]], header_rows: int, out=None) -> None:
-    """Pretty-print a table as an ASCII grid."""
-    stream = out or sys.stdout
+def format_table(rows: List[List[str]], header_rows: int, widths: Optional[List[int]] = None) -> List[str]:
+    """Lay out a table as the lines of an ASCII grid."""
     if not rows:
-        print("  (no textual data)", file=stream)
-        return
+        return ["  (no textual data)"]
 
-    widths = compute_column_widths(rows)
+    if widths is None:
+        widths = compute_column_widths(rows)
     if not widths:
-        print("  (no textual data)", file=stream)
-        return
+        return ["  (no textual data)"]
 
     border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
     header_border = "+" + "+".join("=" * (width + 2) for width in widths) + "+"
+    # One left-aligned field per column, formatted in a single call per line.
+    row_fmt = "| " + " | ".join(f"{{:<{width}}}" for width in widths) + " |"
+    out_lines = [border]
+
+    # Scratch buffers reused for every row and wrapped line of this table.
+    col_range = range(len(widths))
+    wrapped: List[Tuple[str, ...]] = [()] * len(widths)
+    pieces = [""] * len(widths)
 
     def emit_row(row: List[str]) -> None:
-        wrapped = []
-        for col_idx, width in enumerate(widths):
-            cell = row[col_idx] if col_idx < len(row) else ""
-            wrapped.append(wrap_cell(cell, width))
+        # The cached tuples are only read here, so skip wrap_cell's defensive list copy.
+        row_len = len(row)
+        for col_idx in col_range:
+            width = widths[col_idx]
+            cell = row[col_idx] if col_idx < row_len else ""
+            wrapped[col_idx] = _wrap_lines(cell, width) if width > 0 else (cell,)
 
         max_lines = max(len(lines) for lines in wrapped)
         for line_index in range(max_lines):
-            pieces = []
-            for col_idx, width in enumerate(widths):
+            for col_idx in col_range:
                 lines = wrapped[col_idx]
-                fragment = lines[line_index] if line_index < len(lines) else ""
-                pieces.append(f" {fragment.ljust(width)} ")
-            print("|" + "|".join(pieces) + "|", file=stream)
+                pieces[col_idx] = lines[line_index] if line_index < len(lines) else ""
+            out_lines.append(row_fmt.format(*pieces))
 
-    print(border, file=stream)
     for idx, row in enumerate(rows):
         emit_row(row)
         is_last = idx == len(rows) - 1
         if header_rows and idx == header_rows - 1:
-            print(header_border if not is_last else border, file=stream)
+            out_lines.append(header_border if not is_last else border)
         else:
-            print(border, file=stream)
+            out_lines.append(border)
+    return out_lines
+
+
+def render_table(rows: List[List[str]], header_rows: int, out: Optional[TextIO] = None) -> None:
+    """Pretty-print a table as an ASCII grid."""
+    stream = out or sys.stdout
+    stream.write("\n".join(format_table(rows, header_rows)) + "\n")
+
 
+def assemble_tables(tables: List[TableState]) -> List[AssembledTable]:
+    """Assemble every table's rows once so renderers and exporters can share them."""
+    return [(table, *assemble_rows(table)) for table in tables]
 
-def print_tables(tables: List[Dict], out=None) -> None:
+
+def print_tables(tables: List[AssembledTable], out: Optional[TextIO] = None) -> None:
     """Print each table with its inferred title."""
     stream = out or sys.stdout
-    for idx, table in enumerate(tables, start=1):
-        title = table.get("title") or f"Table {idx}"
-        page = table.get("page")
+    for idx, (table, rows, header_rows, widths) in enumerate(tables, start=1):
+        title = table.title or f"Table {idx}"
+        page = table.page
         header = f"Table {idx}: {title}"
         if page is not None:
             header += f" (Page {page})"
-        print(header, file=stream)
-        rows, header_rows = assemble_rows(table)
-        render_table(rows, header_rows, out=stream)
-        print(file=stream)
+        # One write per table: title, grid and the trailing blank line.
+        lines = [header]
+        lines.extend(format_table(rows, header_rows, widths))
+        lines.append("")
+        stream.write("\n".join(lines) + "\n")
 
 
-def export_tables_to_json(tables: List[Dict], output_path: Path) -> None:
+def export_tables_to_json(tables: List[AssembledTable], output_path: Path) -> None:
     """Write all tables to a single JSON file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {"tables": []}
-    for idx, table in enumerate(tables, start=1):
-        title = table.get("title") or f"Table {idx}"
-        rows, header_rows = assemble_rows(table)
+    payload: Dict[str, List[Dict[str, Any]]] = {"tables": []}
+    for idx, (table, rows, _header_rows, _widths) in enumerate(tables, start=1):
+        title = table.title or f"Table {idx}"
         payload["tables"].append(
             {
                 "table_index": idx,
                 "title": title,
-                "page": table.get("page"),
-                "attributes": table.get("attributes", {}),
+                "page": table.page,
+                "attributes": table.attributes,
                 "rows": rows,
             }
         )
-    output_path.write_text(json.dumps(payload, indent=2))
+    _write_json(payload, output_path)
 
 
-def export_tables_sample_json(tables: List[Dict], output_path: Path) -> None:
+def export_tables_sample_json(tables: List[AssembledTable], output_path: Path) -> None:
     """Write a sample JSON containing truncated copies of each table."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {"tables": []}
-    for idx, table in enumerate(tables, start=1):
-        title = table.get("title") or f"Table {idx}"
-        rows, header_rows = assemble_rows(table)
+    payload: Dict[str, List[Dict[str, Any]]] = {"tables": []}
+    for idx, (table, rows, header_rows, _widths) in enumerate(tables, start=1):
+        title = table.title or f"Table {idx}"
         preview_rows = []
         if rows:
             header_rows = max(header_rows, 0)
@@ -312,7 +515,7 @@ def export_tables_sample_json(tables: List[Dict], output_path: Path) -> None:
             data_part = rows[header_rows : header_rows + 5]
             preview_rows = header_part + data_part
 
-        attributes = table.get("attributes", {})
+        attributes = table.attributes
         sample_attributes = {
             key: attributes[key]
             for key in ("NumCol", "NumRow")
@@ -323,15 +526,15 @@ def export_tables_sample_json(tables: List[Dict], output_path: Path) -> None:
             {
                 "table_index": idx,
                 "title": title,
-                "page": table.get("page"),
+                "page": table.page,
                 "attributes": sample_attributes,
                 "rows": preview_rows,
             }
         )
-    output_path.write_text(json.dumps(payload, indent=2))
+    _write_json(payload, output_path)
 
 
-def write_tables_text(tables: List[Dict], output_path: Path) -> None:
+def write_tables_text(tables: List[AssembledTable], output_path: Path) -> None:
     """Persist the pretty-printed tables to a text file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as handle:
@@ -344,6 +547,11 @@ def parse_args() -> argparse.Namespace:
         "directory",
         help="Directory containing extract.zip; outputs will be written here too.",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Parse the structured data incrementally with ijson to lower peak memory (slower).",
+    )
     return parser.parse_args()
 
 
@@ -358,15 +566,15 @@ def main() -> None:
     if not zip_path.exists():
         raise FileNotFoundError(f"Expected extract.zip at {zip_path}. Run extract.py or adjust the directory.")
 
-    data = load_structured_data(zip_path)
-    tables = extract_tables(data["elements"])
+    tables = extract_tables(iter_structured_elements(zip_path, stream=args.stream))
     if not tables:
         text_output_path.parent.mkdir(parents=True, exist_ok=True)
         text_output_path.write_text("No tables found in the structured data.\n", encoding="utf-8")
         return
-    write_tables_text(tables, text_output_path)
-    export_tables_to_json(tables, json_output_path)
-    export_tables_sample_json(tables, sample_output_path)
+    assembled = assemble_tables(tables)
+    write_tables_text(assembled, text_output_path)
+    export_tables_to_json(assembled, json_output_path)
+    export_tables_sample_json(assembled, sample_output_path)
 
 
 if __name__ == "__main__":